@@ -0,0 +1,44 @@
+"""
+Bakes the individual piece sprites into a single pre-resized atlas.
+
+The shipped sprites are 1920x1920 and the GUI resizes them down to the
+square size at startup; baking them into src/gui/images/atlas.png ahead
+of time lets load_piece_images crop ready-made tiles with no resampling
+at all. Run from the repository root after changing any sprite:
+
+    python scripts/build_atlas.py
+
+The layout is six columns (pawn to king, matching the piece type order)
+by two rows (white above black), one square-sized tile per piece.
+"""
+
+import os
+from PIL import Image
+
+SQUARE_SIZE = 100
+IMAGES_DIR = os.path.join('src', 'gui', 'images')
+PIECE_ORDER = ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king')
+COLOUR_ORDER = ('white', 'black')
+
+
+def build_atlas() -> None:
+    """
+    Builds the sprite atlas and writes it next to the source sprites.
+
+    Returns:
+        None
+    """
+    atlas = Image.new('RGBA', (SQUARE_SIZE * 6, SQUARE_SIZE * 2))
+    for row, colour in enumerate(COLOUR_ORDER):
+        for column, piece in enumerate(PIECE_ORDER):
+            image = Image.open(os.path.join(IMAGES_DIR, f'{colour}_{piece}.png'))
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            if image.size != (SQUARE_SIZE, SQUARE_SIZE):
+                image = image.resize((SQUARE_SIZE, SQUARE_SIZE), Image.LANCZOS)
+            atlas.paste(image, (column * SQUARE_SIZE, row * SQUARE_SIZE))
+    atlas.save(os.path.join(IMAGES_DIR, 'atlas.png'))
+
+
+if __name__ == '__main__':
+    build_atlas()
@@ -1,6 +1,35 @@
 from src.game.piece import fen_to_class, Piece, King
-from src.game.colour import Colour
-from src.game.piece_type import PieceType
+from src.game.colour import BLACK, WHITE
+from src.game.magics import (ALL_SQUARES, BETWEEN, KING_ATTACKS, KNIGHT_ATTACKS,
+                             PAWN_ATTACKS, bishop_attacks, iter_bits, rook_attacks)
+from src.game.piece_type import BISHOP, KING, KNIGHT, PAWN, QUEEN, ROOK
+from src.game.zobrist import PIECE_KEYS
+
+# Dispatch table indexed by FEN character code: digits map to a file
+# skip count, piece letters map to a (colour, piece class) pair, and
+# anything else (the rank separator) maps to None.
+FEN_DISPATCH = [None] * 128
+for _digit in '12345678':
+    FEN_DISPATCH[ord(_digit)] = int(_digit)
+for _char, _class in fen_to_class.items():
+    FEN_DISPATCH[ord(_char.upper())] = (WHITE, _class)
+    FEN_DISPATCH[ord(_char)] = (BLACK, _class)
+
+
+def bitboard_index(piece: Piece) -> int:
+    """
+    Returns the index of the bitboard that holds the given piece.
+
+    The 12 bitboards are laid out as the 6 white piece types followed by
+    the 6 black piece types, in piece-type order.
+
+    Args:
+        piece (Piece): The piece to find the bitboard index for.
+
+    Returns:
+        int: The index into Board.bitboards for the piece.
+    """
+    return piece.colour * 6 + piece.piece_type - 1
 
 
 class Board:
@@ -8,15 +37,28 @@ class Board:
     Class representing the chess board.
 
     Attributes:
-        board (list[list[Piece]]): A 2D list representing the board.
+        board (list[list[Piece]]): A 2D list representing the board,
+            kept as a mailbox for O(1) piece lookup by square.
+        bitboards (list[int]): Twelve 64-bit integers, one per colour and
+            piece type, with bit rank*8+file set for each occupied square.
+        occupied_white (int): Bitboard of all squares occupied by white pieces.
+        occupied_black (int): Bitboard of all squares occupied by black pieces.
+        occupied (int): Bitboard of all occupied squares.
+        pieces_by_colour (dict[int, set[Piece]]): The live pieces of each
+            colour, kept up to date by move_piece, undo_move and promote_pawn.
         fen (str): The position of the board in Forsyth-Edwards Notation (FEN).
-        active_colour (Colour): The colour of the player whose turn it is.
+        active_colour (int): The colour of the player whose turn it is.
         castling_rights (str): A string representing the castling rights of both players.
         en_passant_square (str): The square where an en passant capture could be made.
         halfmove_clock (int): The number of halfmoves since the last capture or pawn move.
         fullmove_number (int): The number of fullmoves in the game.
         white_king (King): The white king piece.
         black_king (King): The black king piece.
+        kings (list[King]): Both kings indexed by colour.
+        zobrist (int): Incremental Zobrist hash of the piece placement,
+            kept up to date by set_piece, move_piece and undo_move.
+        _check_info (dict): Cache of (check_mask, pin_masks) pairs keyed
+            by Zobrist hash and colour, so transpositions reuse entries.
         game_active (bool): A flag indicating whether the game is being played.
     """
 
@@ -32,6 +74,11 @@ class Board:
             None
         """
         self.board = [[None for _ in range(8)] for _ in range(8)]
+        self.bitboards = [0] * 12
+        self.occupied_white = 0
+        self.occupied_black = 0
+        self.occupied = 0
+        self.pieces_by_colour = {WHITE: set(), BLACK: set()}
         self.fen = fen
         self.active_colour = None
         self.castling_rights = None
@@ -40,6 +87,9 @@ class Board:
         self.fullmove_number = None
         self.white_king = None
         self.black_king = None
+        self.kings = [None, None]
+        self.zobrist = 0
+        self._check_info = {}
         self.game_active = True
 
         self.parse_fen(self.fen)
@@ -49,18 +99,16 @@ class Board:
         Returns a string representation of the board.
 
         The string representation consists of the pieces on the board arranged in a grid format.
-        Each piece is represented by its string representation, padded with spaces to ensure consistent spacing.
+        Each piece is shown as its cached FEN character and empty squares as dots,
+        built with a single join instead of repeated concatenation.
 
         Returns:
             str: The string representation of the board.
         """
-        board_str = ''
-        for rank in range(7, -1, -1):
-            for file in range(8):
-                piece = self.get_piece(file, rank)
-                board_str += str(piece).ljust(12)
-            board_str += '\n'
-        return board_str
+        return '\n'.join(
+            ''.join(piece._glyph if piece is not None else '.' for piece in self.board[rank])
+            for rank in range(7, -1, -1)
+        ) + '\n'
 
     def get_piece(self, file: int, rank: int) -> Piece:
         """
@@ -80,6 +128,9 @@ class Board:
         """
         Sets the piece at the specified file and rank on the board.
 
+        Keeps the bitboards and occupancy masks in sync with the mailbox:
+        the previous occupant's bit is cleared and the new piece's bit set.
+
         Args:
             file (int): The file (column) index of the piece.
             rank (int): The rank (row) index of the piece.
@@ -88,8 +139,146 @@ class Board:
         Returns:
             None
         """
+        square = rank * 8 + file
+        mask = 1 << square
+        existing = self.board[rank][file]
+        if existing is not None:
+            self.bitboards[bitboard_index(existing)] &= ~mask
+            self.zobrist ^= PIECE_KEYS[bitboard_index(existing)][square]
+            if existing.colour == WHITE:
+                self.occupied_white &= ~mask
+            else:
+                self.occupied_black &= ~mask
+        if piece is not None:
+            self.bitboards[bitboard_index(piece)] |= mask
+            self.zobrist ^= PIECE_KEYS[bitboard_index(piece)][square]
+            if piece.colour == WHITE:
+                self.occupied_white |= mask
+            else:
+                self.occupied_black |= mask
+        self.occupied = self.occupied_white | self.occupied_black
         self.board[rank][file] = piece
 
+    def get_occupancy(self, colour: int) -> int:
+        """
+        Returns the occupancy bitboard for the specified colour.
+
+        Args:
+            colour (int): The colour to get the occupancy for.
+
+        Returns:
+            int: A bitboard of all squares occupied by pieces of the colour.
+        """
+        return self.occupied_white if colour == WHITE else self.occupied_black
+
+    def is_square_attacked(self, square: int, colour: int, occupied: int) -> bool:
+        """
+        Checks whether a square is attacked by the enemies of a colour.
+
+        Intersects each enemy piece bitboard with the attack set of the
+        matching piece placed on the square. The occupancy is passed in
+        so callers can test king moves with the king lifted off the board.
+
+        Args:
+            square (int): The square index (rank * 8 + file) to test.
+            colour (int): The colour defending the square.
+            occupied (int): The occupancy bitboard to trace rays through.
+
+        Returns:
+            bool: True if an enemy piece attacks the square, False otherwise.
+        """
+        bitboards = self.bitboards
+        base = (colour ^ 1) * 6
+
+        # Leaper tests are a single table load and AND each, so run them
+        # before the sliders, which pay for a magic multiply per lookup
+        if PAWN_ATTACKS[colour][square] & bitboards[base + PAWN - 1]:
+            return True
+        if KNIGHT_ATTACKS[square] & bitboards[base + KNIGHT - 1]:
+            return True
+        if KING_ATTACKS[square] & bitboards[base + KING - 1]:
+            return True
+
+        queens = bitboards[base + QUEEN - 1]
+        if bishop_attacks(square, occupied) & (bitboards[base + BISHOP - 1] | queens):
+            return True
+        return bool(rook_attacks(square, occupied) & (bitboards[base + ROOK - 1] | queens))
+
+    def check_info(self, colour: int) -> tuple[int, dict[int, int]]:
+        """
+        Returns the cached check and pin constraints for a colour.
+
+        The cache is keyed on the Zobrist hash of the position and the
+        colour, so revisiting a position (make/unmake, transpositions)
+        reuses the earlier computation instead of redoing it.
+
+        Args:
+            colour (int): The colour whose king is being defended.
+
+        Returns:
+            tuple[int, dict[int, int]]: The (check_mask, pin_masks) pair
+                from compute_check_info.
+        """
+        key = (self.zobrist << 1) | colour
+        info = self._check_info.get(key)
+        if info is None:
+            if len(self._check_info) >= 1 << 18:
+                self._check_info.clear()
+            info = self.compute_check_info(colour)
+            self._check_info[key] = info
+        return info
+
+    def compute_check_info(self, colour: int) -> tuple[int, dict[int, int]]:
+        """
+        Computes the check mask and pin rays for a colour's king.
+
+        The check mask is the set of squares a non-king move may target:
+        every square when the king is not in check, the checking piece
+        and the squares blocking its ray on single check, and empty on
+        double check (only the king may move). The pin masks map the
+        square of each pinned piece to the ray it must stay on.
+
+        Args:
+            colour (int): The colour whose king is being defended.
+
+        Returns:
+            tuple[int, dict[int, int]]: The (check_mask, pin_masks) pair.
+        """
+        king_square = self.kings[colour].square
+        occupied = self.occupied
+        bitboards = self.bitboards
+        base = (colour ^ 1) * 6
+        queens = bitboards[base + QUEEN - 1]
+        bishops = bitboards[base + BISHOP - 1] | queens
+        rooks = bitboards[base + ROOK - 1] | queens
+
+        checkers = (
+            (KNIGHT_ATTACKS[king_square] & bitboards[base + KNIGHT - 1])
+            | (PAWN_ATTACKS[colour][king_square] & bitboards[base + PAWN - 1])
+            | (bishop_attacks(king_square, occupied) & bishops)
+            | (rook_attacks(king_square, occupied) & rooks)
+        )
+        if checkers == 0:
+            check_mask = ALL_SQUARES
+        elif checkers & (checkers - 1):
+            check_mask = 0
+        else:
+            check_mask = checkers | BETWEEN[king_square][checkers.bit_length() - 1]
+
+        # A piece is pinned when it is the only friendly piece between
+        # the king and an enemy slider whose ray would otherwise hit it
+        pin_masks = {}
+        own = self.get_occupancy(colour)
+        without_own = occupied & ~own
+        for attacks, sliders in ((rook_attacks, rooks), (bishop_attacks, bishops)):
+            snipers = attacks(king_square, without_own) & sliders
+            for sniper in iter_bits(snipers):
+                between = BETWEEN[king_square][sniper]
+                blockers = between & own
+                if blockers and not blockers & (blockers - 1):
+                    pin_masks[blockers.bit_length() - 1] = between | (1 << sniper)
+        return check_mask, pin_masks
+
     def get_board(self) -> list[list[Piece]]:
         """
         Returns the board as a 2D list of pieces.
@@ -114,35 +303,40 @@ class Board:
         """
         parts = fen.split()
         self.load_fen(parts[0])
-        self.active_colour = Colour.WHITE if parts[1] == 'w' else Colour.BLACK
+        self.active_colour = WHITE if parts[1] == 'w' else BLACK
         self.castling_rights = parts[2]
         self.en_passant_square = parts[3]
         self.halfmove_clock = int(parts[4])
         self.fullmove_number = int(parts[5])
-        self.white_king = self.find_king(Colour.WHITE)
-        self.black_king = self.find_king(Colour.BLACK)
+        self.white_king = self.find_king(WHITE)
+        self.black_king = self.find_king(BLACK)
+        # The same King objects move around the board, so these references
+        # (and their cached squares) stay valid for the whole game.
+        self.kings = [self.white_king, self.black_king]
 
-    def find_king(self, colour: Colour) -> Piece:
+    def find_king(self, colour: int) -> Piece:
         """
         Finds the king of the specified colour on the board.
 
         Args:
-            colour (Colour): The colour of the king to find.
+            colour (int): The colour of the king to find.
 
         Returns:
             Piece: The king piece of the specified colour.
         """
-        for rank in range(8):
-            for file in range(8):
-                piece = self.get_piece(file, rank)
-                if piece is not None and piece.colour == colour and piece.piece_type == PieceType.KING:
-                    return piece
+        for piece in self.pieces_by_colour[colour]:
+            if piece.piece_type == KING:
+                return piece
         return None
 
     def load_fen(self, fen: str) -> None:
         """
         Loads the piece positions from the FEN string.
 
+        Each character is resolved through the FEN_DISPATCH table, which
+        replaces the per-character isdigit/isupper tests and class lookup
+        with a single indexed load.
+
         Args:
             fen (str): The FEN string representing the piece positions.
 
@@ -151,34 +345,20 @@ class Board:
         """
         file, rank = 0, 7
         for char in fen:
-            if char == '/':
+            entry = FEN_DISPATCH[ord(char)]
+            if entry is None:
                 file = 0
                 rank -= 1
-            elif char.isdigit():
-                file += int(char)
+            elif type(entry) is int:
+                file += entry
             else:
-                piece = self.create_piece(char, file, rank)
+                colour, piece_class = entry
+                piece = piece_class(colour)
+                piece.set_position(file, rank)
                 self.set_piece(file, rank, piece)
+                self.pieces_by_colour[colour].add(piece)
                 file += 1
 
-    def create_piece(self, char: str, file: int, rank: int) -> Piece:
-        """
-        Creates a piece object based on the FEN character representation.
-
-        Args:
-            char (str): The FEN character representing the piece.
-            file (int): The file (column) index of the piece.
-            rank (int): The rank (row) index of the piece.
-
-        Returns:
-            Piece: The piece object created based on the FEN character representation.
-        """
-        colour = Colour.WHITE if char.isupper() else Colour.BLACK
-        piece_class = fen_to_class[char.lower()]
-        piece = piece_class(colour)
-        piece.set_position(file, rank)
-        return piece
-
     def move_piece(self, piece: Piece, destination: tuple[int, int]) -> Piece:
         """
         Moves a piece to the specified destination on the board.
@@ -192,14 +372,34 @@ class Board:
         """
         file, rank = destination
 
-        # Check if the move is a capture
-        captured_piece = self.get_piece(file, rank)
+        to_square = rank * 8 + file
+        to_mask = 1 << to_square
 
-        # Move the piece to the new position
-        self.set_piece(file, rank, piece)
+        # Check if the move is a capture
+        captured_piece = self.board[rank][file]
+        if captured_piece is not None:
+            self.bitboards[bitboard_index(captured_piece)] ^= to_mask
+            self.zobrist ^= PIECE_KEYS[bitboard_index(captured_piece)][to_square]
+            if captured_piece.colour == WHITE:
+                self.occupied_white ^= to_mask
+            else:
+                self.occupied_black ^= to_mask
+            self.pieces_by_colour[captured_piece.colour].discard(captured_piece)
+
+        # Move the piece with a single from/to XOR of its bitboard
+        move_mask = (1 << piece.square) | to_mask
+        index = bitboard_index(piece)
+        self.bitboards[index] ^= move_mask
+        keys = PIECE_KEYS[index]
+        self.zobrist ^= keys[piece.square] ^ keys[to_square]
+        if piece.colour == WHITE:
+            self.occupied_white ^= move_mask
+        else:
+            self.occupied_black ^= move_mask
+        self.occupied = self.occupied_white | self.occupied_black
 
-        # Remove the piece from its previous position
-        self.set_piece(piece.file, piece.rank, None)
+        self.board[rank][file] = piece
+        self.board[piece.rank][piece.file] = None
         piece.set_position(file, rank)
 
         return captured_piece
@@ -220,9 +420,11 @@ class Board:
 
         # Remove the pawn from the board
         self.set_piece(pawn.file, pawn.rank, None)
+        self.pieces_by_colour[pawn.colour].discard(pawn)
 
         # Place the new piece on the board
         self.set_piece(file, rank, new_piece)
+        self.pieces_by_colour[new_piece.colour].add(new_piece)
         new_piece.set_position(file, rank)
 
         return new_piece
@@ -241,14 +443,35 @@ class Board:
             None
         """
         original_file, original_rank = original_position
-        current_file, current_rank = piece.get_position()
-
-        # Move the piece back to its original position
-        self.set_piece(original_file, original_rank, piece)
+        current_file, current_rank = piece.file, piece.rank
+        current_square = piece.square
+        current_mask = 1 << current_square
+
+        # Move the piece back with a single from/to XOR of its bitboard
+        original_square = original_rank * 8 + original_file
+        move_mask = current_mask | (1 << original_square)
+        index = bitboard_index(piece)
+        self.bitboards[index] ^= move_mask
+        keys = PIECE_KEYS[index]
+        self.zobrist ^= keys[current_square] ^ keys[original_square]
+        if piece.colour == WHITE:
+            self.occupied_white ^= move_mask
+        else:
+            self.occupied_black ^= move_mask
+        self.board[original_rank][original_file] = piece
         piece.set_position(original_file, original_rank)
 
         # Restore the captured piece
-        self.set_piece(current_file, current_rank, captured_piece)
+        self.board[current_rank][current_file] = captured_piece
+        if captured_piece is not None:
+            self.bitboards[bitboard_index(captured_piece)] ^= current_mask
+            self.zobrist ^= PIECE_KEYS[bitboard_index(captured_piece)][current_square]
+            if captured_piece.colour == WHITE:
+                self.occupied_white ^= current_mask
+            else:
+                self.occupied_black ^= current_mask
+            self.pieces_by_colour[captured_piece.colour].add(captured_piece)
+        self.occupied = self.occupied_white | self.occupied_black
 
     def update_game_state(self) -> None:
         """
@@ -259,8 +482,8 @@ class Board:
         Returns:
             None
         """
-        self.active_colour = Colour.WHITE if self.active_colour == Colour.BLACK else Colour.BLACK
-        if self.active_colour == Colour.WHITE:
+        self.active_colour ^= 1
+        if self.active_colour == WHITE:
             self.fullmove_number += 1
         self.halfmove_clock += 1
 
@@ -276,15 +499,10 @@ class Board:
         Returns:
             bool: True if the king is in checkmate, False otherwise.
         """
-        colour = king.colour
-        # Loop through board, if piece is same colour as king, check if it can move
-        for rank in range(8):
-            for file in range(8):
-                piece = self.get_piece(file, rank)
-                if piece is not None and piece.colour == colour:
-                    moves = piece.generate_moves(self)
-                    if moves:
-                        return False
+        # If any piece of the king's colour can move, it is not checkmate
+        for piece in self.pieces_by_colour[king.colour]:
+            if piece.generate_moves(self):
+                return False
         return True
 
     def check_for_draw(self) -> None:
@@ -319,11 +537,7 @@ class Board:
             bool: True if the game is a stalemate, False otherwise.
         """
         # Check if active player has any legal moves
-        for rank in range(8):
-            for file in range(8):
-                piece = self.get_piece(file, rank)
-                if piece is not None and piece.colour == self.active_colour:
-                    moves = piece.generate_moves(self)
-                    if moves:
-                        return False
+        for piece in self.pieces_by_colour[self.active_colour]:
+            if piece.generate_moves(self):
+                return False
         return True
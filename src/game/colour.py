@@ -1,7 +1,7 @@
-from enum import Enum
+"""Integer constants representing the colour of a piece."""
 
+WHITE = 0
+BLACK = 1
 
-class Colour(Enum):
-    """Enum representing the colour of a piece."""
-    WHITE = 0b1000
-    BLACK = 0b0000
+# Display names indexed by colour
+COLOUR_NAME = ('WHITE', 'BLACK')
@@ -0,0 +1,309 @@
+"""
+Precomputed magic-bitboard attack tables for the sliding pieces.
+
+A magic bitboard replaces the square-by-square ray walk of a sliding
+piece with a single table lookup: the blockers on the piece's rays are
+masked out of the occupancy bitboard, multiplied by a "magic" constant
+and shifted down to give a perfect-hash index into a table of
+precomputed attack sets. The tables are built once at import from the
+magic constants below (found offline by random search).
+"""
+
+_U64 = (1 << 64) - 1
+
+# Mask of every square on the board, for clamping shifted bitboards
+ALL_SQUARES = _U64
+
+# File and rank masks used by the bitboard shift arithmetic
+FILE_A = 0x0101010101010101
+FILE_H = 0x8080808080808080
+RANK_3 = 0x0000000000FF0000
+RANK_6 = 0x0000FF0000000000
+
+_ROOK_DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+_BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+ROOK_MAGICS = (
+    0x11800010400C8220, 0xA040100020004000,
+    0x4080100020000880, 0x2080048008001000,
+    0x0100080004100300, 0x0500110024001208,
+    0x0400011000880204, 0xA0801A4100002080,
+    0x0044800240018020, 0x4108404010002000,
+    0x2000808010002000, 0x0010808010000800,
+    0x1200800800040080, 0x404C808002000400,
+    0x20110049000C0200, 0x0201800100244080,
+    0x1080004040002000, 0x800C908020004000,
+    0x2042020010804021, 0x0120848010000800,
+    0x80C0808004000800, 0x0A00080104102040,
+    0x0040040002900158, 0x0000020004004081,
+    0xA010400080003080, 0x0000200080804000,
+    0x0200600280100281, 0x0005000900100121,
+    0x0080040080080080, 0x0200040080020080,
+    0x001011C400180210, 0x2700010200006094,
+    0x2001008202002048, 0x08B0044002C02008,
+    0x1000200011004100, 0xA000100101002008,
+    0x0000802801800401, 0x0002040080800200,
+    0x2301002431002A00, 0x0A40800040800100,
+    0x20800244A0044000, 0x0410004020084010,
+    0x0A00408012020021, 0x0051010C10010020,
+    0x2148050008010010, 0x240A000400808002,
+    0x0104020001008080, 0x3021000080410002,
+    0x0080004106856900, 0x0020008020401880,
+    0x0A181000A0048180, 0x5810008801805080,
+    0x0000040008008280, 0x0804020004008080,
+    0x0912101108124400, 0x0402004C00912200,
+    0x038021011181C206, 0x080021004012008A,
+    0x0060402000100901, 0xB1212420300100C9,
+    0x0C02001008200402, 0x00010024001208C1,
+    0x0054421008008104, 0x0048002100804C02,
+)
+BISHOP_MAGICS = (
+    0x0204080084009A02, 0x3020140400485041,
+    0x0008008102104008, 0x04882A4100020220,
+    0x4C08484001014030, 0x0002080208401880,
+    0x8000480804900202, 0x080220221004A000,
+    0x0100192845080200, 0x0000A00810809090,
+    0x420108422C022104, 0x081020A080889020,
+    0x06040510C0088028, 0x0288011002101804,
+    0x0002440228820832, 0x001061040A261201,
+    0x0089004110040080, 0x2062020410940510,
+    0x20011410004600C0, 0x0804000840112000,
+    0x3081020820080100, 0xA01F004808861000,
+    0x0000400094042005, 0x060102004400841B,
+    0x0320612008084148, 0x0030089402089D00,
+    0x0008240008880202, 0x8040040033101020,
+    0x0101010020104002, 0x0082002094100800,
+    0x000082040108024A, 0x008A020C04808088,
+    0x20106C1009210A03, 0x1021082000020440,
+    0x0018280404080020, 0x0810020080F80080,
+    0x0140020200202081, 0x8040810101420082,
+    0x0108250040040E00, 0x9028004118004100,
+    0x4088040208402010, 0x0002280202000800,
+    0x020C101088209001, 0x0000004208001080,
+    0x00004C100C000180, 0x0002008505000A00,
+    0x9A21040104428204, 0x0102040102018824,
+    0x8003045602400010, 0x0C02022901282C40,
+    0x0120888088212022, 0x8200522020880030,
+    0x0060112020410080, 0x3840081010008800,
+    0x0010204101120008, 0x80240112040304C0,
+    0x0211260050041012, 0x124200804802D004,
+    0xC002040D00A09002, 0x0C00100020841100,
+    0x0000008040882200, 0x8028221042100440,
+    0x0008908322140408, 0x000C30100501208C,
+)
+
+def _ray_attacks(square: int, occupied: int, directions: tuple) -> int:
+    """
+    Computes the attack set of a slider on a square by walking its rays.
+
+    Used only while building the lookup tables at import time.
+
+    Args:
+        square (int): The square index (rank * 8 + file) of the slider.
+        occupied (int): The occupancy bitboard blocking the rays.
+        directions (tuple): The (dx, dy) ray directions of the slider.
+
+    Returns:
+        int: A bitboard of the squares attacked by the slider.
+    """
+    attacks = 0
+    file, rank = square & 7, square >> 3
+    for dx, dy in directions:
+        x, y = file + dx, rank + dy
+        while 0 <= x < 8 and 0 <= y < 8:
+            bit = 1 << (y * 8 + x)
+            attacks |= bit
+            if occupied & bit:
+                break
+            x += dx
+            y += dy
+    return attacks
+
+
+def _relevant_mask(square: int, directions: tuple) -> int:
+    """
+    Computes the relevant occupancy mask for a slider on a square.
+
+    The mask covers the squares whose occupancy can change the slider's
+    attack set; the outermost square of each ray never can, so it is
+    excluded to keep the tables small.
+
+    Args:
+        square (int): The square index (rank * 8 + file) of the slider.
+        directions (tuple): The (dx, dy) ray directions of the slider.
+
+    Returns:
+        int: The relevant occupancy bitboard for the square.
+    """
+    mask = 0
+    file, rank = square & 7, square >> 3
+    for dx, dy in directions:
+        x, y = file + dx, rank + dy
+        while 0 <= x + dx < 8 and 0 <= y + dy < 8:
+            mask |= 1 << (y * 8 + x)
+            x += dx
+            y += dy
+    return mask
+
+
+def iter_bits(bitboard: int):
+    """
+    Yields the square index of each set bit in a bitboard, lowest first.
+
+    Uses the x & -x lowest-set-bit isolation trick with int.bit_length,
+    both of which run at C level.
+
+    Args:
+        bitboard (int): The bitboard to enumerate.
+
+    Yields:
+        int: The square index of each set bit.
+    """
+    while bitboard:
+        lsb = bitboard & -bitboard
+        yield lsb.bit_length() - 1
+        bitboard ^= lsb
+
+
+def popcount(bitboard: int) -> int:
+    """
+    Counts the set bits in a bitboard.
+
+    Args:
+        bitboard (int): The bitboard to count.
+
+    Returns:
+        int: The number of set bits.
+    """
+    return bitboard.bit_count()
+
+
+def _build_tables(magics: tuple, directions: tuple) -> tuple:
+    """
+    Builds the per-square masks, shifts and attack tables for a slider.
+
+    Enumerates every subset of each square's relevant occupancy mask and
+    stores its ray attack set at the index produced by the magic hash.
+
+    Args:
+        magics (tuple): The 64 magic constants for the slider.
+        directions (tuple): The (dx, dy) ray directions of the slider.
+
+    Returns:
+        tuple: The (masks, shifts, attack_tables) lists, indexed by square.
+    """
+    masks, shifts, tables = [], [], []
+    for square in range(64):
+        mask = _relevant_mask(square, directions)
+        shift = 64 - popcount(mask)
+        magic = magics[square]
+        table = [0] * (1 << (64 - shift))
+        subset = 0
+        while True:
+            index = ((subset * magic) & _U64) >> shift
+            table[index] = _ray_attacks(square, subset, directions)
+            subset = (subset - mask) & mask
+            if subset == 0:
+                break
+        masks.append(mask)
+        shifts.append(shift)
+        tables.append(table)
+    return masks, shifts, tables
+
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_ATTACKS = _build_tables(ROOK_MAGICS, _ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_ATTACKS = _build_tables(BISHOP_MAGICS, _BISHOP_DIRECTIONS)
+
+
+def _leaper_attacks(offsets: tuple) -> tuple:
+    """
+    Builds a 64-entry attack table for a leaping piece.
+
+    Args:
+        offsets (tuple): The (dx, dy) offsets the piece can leap to.
+
+    Returns:
+        tuple: A bitboard of reachable squares for each origin square.
+    """
+    table = []
+    for square in range(64):
+        file, rank = square & 7, square >> 3
+        attacks = 0
+        for dx, dy in offsets:
+            x, y = file + dx, rank + dy
+            if 0 <= x < 8 and 0 <= y < 8:
+                attacks |= 1 << (y * 8 + x)
+        table.append(attacks)
+    return tuple(table)
+
+
+KNIGHT_ATTACKS = _leaper_attacks(((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)))
+KING_ATTACKS = _leaper_attacks(((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)))
+
+def _between_table() -> tuple:
+    """
+    Builds the 64x64 table of squares strictly between two squares.
+
+    BETWEEN[a][b] is a bitboard of the squares on the straight or
+    diagonal line from a to b, excluding both endpoints, or 0 when the
+    squares are not aligned. Used for pin rays and check blocking.
+
+    Returns:
+        tuple: The 64x64 table of between bitboards.
+    """
+    table = [[0] * 64 for _ in range(64)]
+    for square in range(64):
+        file, rank = square & 7, square >> 3
+        for dx, dy in _ROOK_DIRECTIONS + _BISHOP_DIRECTIONS:
+            between = 0
+            x, y = file + dx, rank + dy
+            while 0 <= x < 8 and 0 <= y < 8:
+                target = y * 8 + x
+                table[square][target] = between
+                between |= 1 << target
+                x += dx
+                y += dy
+    return tuple(tuple(row) for row in table)
+
+
+BETWEEN = _between_table()
+
+
+# Pawn capture targets per colour and square; white pawns attack up the
+# board, black pawns down. Also used in reverse by the check test: the
+# enemy pawns giving check sit on the squares the king's own-colour pawn
+# would attack.
+PAWN_ATTACKS = (
+    _leaper_attacks(((-1, 1), (1, 1))),
+    _leaper_attacks(((-1, -1), (1, -1))),
+)
+
+
+def rook_attacks(square: int, occupied: int) -> int:
+    """
+    Looks up the rook attack set for a square and occupancy.
+
+    Args:
+        square (int): The square index (rank * 8 + file) of the rook.
+        occupied (int): The bitboard of all occupied squares.
+
+    Returns:
+        int: A bitboard of the squares attacked by the rook.
+    """
+    index = (((occupied & ROOK_MASKS[square]) * ROOK_MAGICS[square]) & _U64) >> ROOK_SHIFTS[square]
+    return ROOK_ATTACKS[square][index]
+
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    """
+    Looks up the bishop attack set for a square and occupancy.
+
+    Args:
+        square (int): The square index (rank * 8 + file) of the bishop.
+        occupied (int): The bitboard of all occupied squares.
+
+    Returns:
+        int: A bitboard of the squares attacked by the bishop.
+    """
+    index = (((occupied & BISHOP_MASKS[square]) * BISHOP_MAGICS[square]) & _U64) >> BISHOP_SHIFTS[square]
+    return BISHOP_ATTACKS[square][index]
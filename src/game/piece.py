@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
-from src.game.colour import Colour
-from src.game.piece_type import PieceType
+from src.game.colour import BLACK, WHITE
+from src.game.magics import (ALL_SQUARES, KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS,
+                             RANK_3, RANK_6, bishop_attacks, iter_bits, rook_attacks)
+from src.game.piece_type import BISHOP, KING, KNIGHT, NONE, PAWN, QUEEN, ROOK
 
 if TYPE_CHECKING:
     from src.game.board import Board
@@ -11,90 +13,123 @@ class Piece:
     Class representing a chess piece.
 
     Each piece is represented by a colour and a piece type.
-    This is encoded as a 5 bit number:
-    - The first bit represents the colour of the piece (0 for white, 1 for black).
-    - The following 4 bits represent the type of the piece (see PieceType).
+    This is encoded as a 4 bit number:
+    - The high bit represents the colour of the piece (0 for white, 1 for black).
+    - The low 3 bits represent the type of the piece (see piece_type).
 
     Attributes:
-        piece_type (PieceType): The type of the piece.
-        colour (Colour): The colour of the piece.
+        piece_type (int): The type of the piece.
+        colour (int): The colour of the piece.
         rank (int): The rank of the piece on the board.
         file (int): The file of the piece on the board.
-        moves (list[tuple[int, int]]): A list of possible moves for the piece.
+        square (int): The square index (rank * 8 + file) of the piece.
+        code (int): The 4-bit colour/type encoding, precomputed at
+            construction since both fields are fixed for life.
+        _glyph (str): The cached FEN character used for display.
+        moves (list[int]): A list of packed moves for the piece.
+        targets (int): A bitboard of the destination squares in moves,
+            for O(1) legality tests.
+        _moves_key (int): The Zobrist hash the cached moves were
+            computed for, or None before the first computation.
     """
 
-    def __init__(self, colour: Colour, piece_type: PieceType = PieceType.NONE) -> None:
+    __slots__ = ('piece_type', 'colour', 'rank', 'file', 'square', 'code', 'moves', 'targets', '_glyph', '_moves_key')
+
+    def __init__(self, colour: int, piece_type: int = NONE) -> None:
         """
         Initializes a chess piece.
 
         Args:
-            colour (Colour): The colour of the piece.
-            piece_type (PieceType): The type of the piece.
+            colour (int): The colour of the piece.
+            piece_type (int): The type of the piece.
 
         Returns:
             None
         """
         self.piece_type = piece_type
         self.colour = colour
+        self.code = (colour << 3) | piece_type
         self.rank = None
         self.file = None
+        self.square = None
         self.moves = []
+        self.targets = 0
+        self._moves_key = None
+        self._glyph = self.get_fen_char()
 
     def __str__(self) -> str:
         """
         Returns a string representation of the piece.
 
-        Format is "<colour> <piece_type>".
+        Format is the piece's FEN character, cached at construction.
 
         Returns:
             str: A string representation of the piece.
         """
-        return f'{self.colour.name} {self.piece_type.name}'
+        return self._glyph
 
     def encode(self) -> int:
         """
-        Encodes the piece as a 5 bit number.
+        Encodes the piece as a 4 bit number.
 
-        The first bit is the colour of the piece (0 for white, 1 for black).
-        The following 4 bits represent the type of the piece (see PieceType).
+        The high bit is the colour of the piece (0 for white, 1 for black).
+        The low 3 bits represent the type of the piece (see piece_type).
+        The value is precomputed at construction.
 
         Returns:
             int: The encoded piece.
         """
-        return self.colour.value | self.piece_type.value
+        return self.code
 
-    def generate_moves(self, board: 'Board', file: int, rank: int) -> list[tuple[int, int]]:
+    def generate_moves(self, board: 'Board') -> list[int]:
         """
-        Generates a list of possible moves for the piece.
+        Returns the legal moves for the piece, cached per position.
 
-        This method should be overridden by subclasses.
+        The cache is keyed on the board's Zobrist hash, so asking again
+        in an unchanged position (repeated clicks on the same piece, or
+        the checkmate and stalemate scans) returns the stored list
+        without recomputing it. Also maintains targets, the bitboard of
+        the move destinations, alongside the list.
 
         Args:
             board (Board): The board object representing the chess board.
-            file (int): The file (column) index of the piece.
-            rank (int): The rank (row) index of the piece.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the piece.
+            list[int]: A list of packed moves for the piece.
+        """
+        if self._moves_key != board.zobrist:
+            self.moves = self.compute_moves(board)
+            targets = 0
+            for move in self.moves:
+                targets |= 1 << (move & 63)
+            self.targets = targets
+            self._moves_key = board.zobrist
+        return self.moves
 
-        Raises:
-            NotImplementedError: This method should be overridden by subclasses.
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
-        raise NotImplementedError
+        Computes the legal moves for the piece.
 
-    def get_position(self) -> tuple[int, int]:
-        """
-        Get the position of the piece on the board.
+        This method should be overridden by subclasses.
+
+        Args:
+            board (Board): The board object representing the chess board.
 
         Returns:
-            tuple[int, int]: The file and rank of the piece.
+            list[int]: A list of packed moves for the piece.
+
+        Raises:
+            NotImplementedError: This method should be overridden by subclasses.
         """
-        return self.file, self.rank
+        raise NotImplementedError
 
     def set_position(self, file: int, rank: int) -> None:
         """
         Set the position of the piece on the board.
 
+        Also caches the square index so move generation can index the
+        bitboard tables without recomputing it.
+
         Args:
             file (int): The file (column) index of the piece.
             rank (int): The rank (row) index of the piece.
@@ -104,63 +139,17 @@ class Piece:
         """
         self.file = file
         self.rank = rank
+        self.square = rank * 8 + file
 
-    def get_type(self) -> PieceType:
+    def get_type(self) -> int:
         """
         Get the type of the piece.
 
         Returns:
-            PieceType: The type of the piece.
+            int: The type of the piece.
         """
         return self.piece_type
 
-    def filter_self_check_moves(self, board: 'Board', moves: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        """
-        Filter out moves that would put the friendly king in check.
-
-        Args:
-            board (Board): The board object representing the chess board.
-            moves (list[tuple[int, int]]): A list of possible moves for the piece.
-
-        Returns:
-            list[tuple[int, int]]: A list of possible moves that do not put the friendly king in check.
-        """
-        filtered_moves = []
-        for move in moves:
-            original_position = self.get_position()
-            captured_piece = board.move_piece(self, move)
-
-            king = board.white_king if self.colour == Colour.WHITE else board.black_king
-            if not king.in_check(board):
-                filtered_moves.append(move)
-            board.undo_move(self, original_position, captured_piece)
-        return filtered_moves
-
-    def filter_in_check_moves(self, board: 'Board', moves: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        """
-        Filter out moves that would leave the friendly king in check.
-
-        Args:
-            board (Board): The board object representing the chess board.
-            moves (list[tuple[int, int]]): A list of possible moves for the piece.
-
-        Returns:
-            list[tuple[int, int]]: A list of possible moves that block the check.
-        """
-        king = board.white_king if self.colour == Colour.WHITE else board.black_king
-
-        if not king.in_check(board):
-            return moves
-
-        filtered_moves = []
-        for move in moves:
-            original_position = self.get_position()
-            captured_piece = board.move_piece(self, move)
-            if not king.in_check(board):
-                filtered_moves.append(move)
-            board.undo_move(self, original_position, captured_piece)
-        return filtered_moves
-
     def get_fen_char(self) -> str:
         """
         Get the FEN character representing the piece.
@@ -168,7 +157,7 @@ class Piece:
         Returns:
             str: The FEN character representing the piece.
         """
-        return 'PNBRQK'[self.piece_type.value] if self.colour == Colour.WHITE else 'pnbrqk'[self.piece_type.value]
+        return ' PNBRQK'[self.piece_type] if self.colour == WHITE else ' pnbrqk'[self.piece_type]
 
 
 class Pawn(Piece):
@@ -178,50 +167,55 @@ class Pawn(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
+    __slots__ = ()
+
+    def __init__(self, colour: int) -> None:
         """
         Initializes a pawn piece.
 
         Args:
-            colour (Colour): The colour of the pawn.
+            colour (int): The colour of the pawn.
 
         Returns:
             None
         """
-        super().__init__(colour, PieceType.PAWN)
+        super().__init__(colour, PAWN)
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the pawn.
 
-        This method takes into account the special rules for pawn moves, such as double moves and captures.
+        Pushes are computed with bitboard shifts on the pawn's square
+        mask: a single push is the mask shifted one rank into empty
+        squares, and a double push shifts the single push again from the
+        start rank. Captures come from the precomputed per-colour attack
+        table intersected with enemy occupancy.
+
         Args:
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the pawn.
-        """
-        moves = []
-        file, rank = self.get_position()
-        direction = 1 if self.colour == Colour.WHITE else -1
-        if board.get_piece(file, rank + direction) is None:
-            moves.append((file, rank + direction))
-
-            # Check for double move
-            if ((rank == 1 and direction == 1) or (rank == 6 and direction == -1)) and (
-                board.get_piece(file, rank + 2 * direction) is None
-            ):
-                moves.append((file, rank + 2 * direction))
+            list[int]: A list of packed moves for the pawn.
+        """
+        origin = self.square << 6
+        mask = 1 << self.square
+        empty = ~board.occupied & ALL_SQUARES
+        if self.colour == WHITE:
+            single = (mask << 8) & empty
+            targets = single | ((single & RANK_3) << 8) & empty
+            targets |= PAWN_ATTACKS[WHITE][self.square] & board.occupied_black
+        else:
+            single = (mask >> 8) & empty
+            targets = single | ((single & RANK_6) >> 8) & empty
+            targets |= PAWN_ATTACKS[BLACK][self.square] & board.occupied_white
+
+        check_mask, pin_masks = board.check_info(self.colour)
+        targets &= check_mask
+        pin = pin_masks.get(self.square)
+        if pin is not None:
+            targets &= pin
+        moves = [origin | target for target in iter_bits(targets)]
 
-        for attack in [-1, 1]:
-            target = board.get_piece(file + attack, rank + direction) if 0 <= file + attack < 8 else None
-            if target is not None and target.colour != self.colour:
-                moves.append((file + attack, rank + direction))
-
-        moves = self.filter_self_check_moves(board, moves)
-        moves = self.filter_in_check_moves(board, moves)
-
-        self.moves = moves
         return moves
 
 
@@ -232,19 +226,21 @@ class Knight(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
+    __slots__ = ()
+
+    def __init__(self, colour: int) -> None:
         """
         Initializes a knight piece.
 
         Args:
-            colour (Colour): The colour of the knight.
+            colour (int): The colour of the knight.
 
         Returns:
             None
         """
-        super().__init__(colour, PieceType.KNIGHT)
+        super().__init__(colour, KNIGHT)
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the knight.
 
@@ -252,20 +248,18 @@ class Knight(Piece):
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the knight.
-        """
-        moves = []
-        file, rank = self.get_position()
-        for dx, dy in [(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)]:
-            if 0 <= file + dx < 8 and 0 <= rank + dy < 8:
-                target = board.get_piece(file + dx, rank + dy)
-                if target is None or target.colour != self.colour:
-                    moves.append((file + dx, rank + dy))
-
-        moves = self.filter_self_check_moves(board, moves)
-        moves = self.filter_in_check_moves(board, moves)
+            list[int]: A list of packed moves for the knight.
+        """
+        square = self.square
+        origin = square << 6
+        attacks = KNIGHT_ATTACKS[square] & ~board.get_occupancy(self.colour)
+        check_mask, pin_masks = board.check_info(self.colour)
+        attacks &= check_mask
+        pin = pin_masks.get(square)
+        if pin is not None:
+            attacks &= pin
+        moves = [origin | target for target in iter_bits(attacks)]
 
-        self.moves = moves
         return moves
 
 
@@ -276,10 +270,12 @@ class Bishop(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
-        super().__init__(colour, PieceType.BISHOP)
+    __slots__ = ()
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def __init__(self, colour: int) -> None:
+        super().__init__(colour, BISHOP)
+
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the bishop.
 
@@ -287,28 +283,18 @@ class Bishop(Piece):
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the bishop.
-        """
-        moves = []
-        file, rank = self.get_position()
-        for dx, dy in [(1, 1), (1, -1), (-1, -1), (-1, 1)]:
-            x, y = file + dx, rank + dy
-            while 0 <= x < 8 and 0 <= y < 8:
-                target = board.get_piece(x, y)
-                if target is None:
-                    moves.append((x, y))
-                elif target.colour != self.colour:
-                    moves.append((x, y))
-                    break
-                else:
-                    break
-                x += dx
-                y += dy
-
-        moves = self.filter_self_check_moves(board, moves)
-        moves = self.filter_in_check_moves(board, moves)
-
-        self.moves = moves
+            list[int]: A list of packed moves for the bishop.
+        """
+        square = self.square
+        origin = square << 6
+        attacks = bishop_attacks(square, board.occupied) & ~board.get_occupancy(self.colour)
+        check_mask, pin_masks = board.check_info(self.colour)
+        attacks &= check_mask
+        pin = pin_masks.get(square)
+        if pin is not None:
+            attacks &= pin
+        moves = [origin | target for target in iter_bits(attacks)]
+
         return moves
 
 
@@ -319,19 +305,21 @@ class Rook(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
+    __slots__ = ()
+
+    def __init__(self, colour: int) -> None:
         """
         Initializes a rook piece.
 
         Args:
-            colour (Colour): The colour of the rook.
+            colour (int): The colour of the rook.
 
         Returns:
             None
         """
-        super().__init__(colour, PieceType.ROOK)
+        super().__init__(colour, ROOK)
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the rook.
 
@@ -339,28 +327,18 @@ class Rook(Piece):
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the rook.
-        """
-        moves = []
-        file, rank = self.get_position()
-        for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-            x, y = file + dx, rank + dy
-            while 0 <= x < 8 and 0 <= y < 8:
-                target = board.get_piece(x, y)
-                if target is None:
-                    moves.append((x, y))
-                elif target.colour != self.colour:
-                    moves.append((x, y))
-                    break
-                else:
-                    break
-                x += dx
-                y += dy
-
-        moves = self.filter_self_check_moves(board, moves)
-        moves = self.filter_in_check_moves(board, moves)
-
-        self.moves = moves
+            list[int]: A list of packed moves for the rook.
+        """
+        square = self.square
+        origin = square << 6
+        attacks = rook_attacks(square, board.occupied) & ~board.get_occupancy(self.colour)
+        check_mask, pin_masks = board.check_info(self.colour)
+        attacks &= check_mask
+        pin = pin_masks.get(square)
+        if pin is not None:
+            attacks &= pin
+        moves = [origin | target for target in iter_bits(attacks)]
+
         return moves
 
 
@@ -371,37 +349,45 @@ class Queen(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
+    __slots__ = ()
+
+    def __init__(self, colour: int) -> None:
         """
         Initializes a queen piece.
 
         Args:
-            colour (Colour): The colour of the queen.
+            colour (int): The colour of the queen.
 
         Returns:
             None
         """
-        super().__init__(colour, PieceType.QUEEN)
+        super().__init__(colour, QUEEN)
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the queen.
 
-        Combines the moves of a rook and a bishop.
+        Combines the rook and bishop attack lookups into a single set so
+        the moves are decoded and filtered in one pass.
 
         Args:
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the queen.
-        """
-        # Combine the moves of a rook and a bishop
-        rook_moves = Rook.generate_moves(self, board)
-        bishop_moves = Bishop.generate_moves(self, board)
-        moves = rook_moves + bishop_moves
-        moves = self.filter_self_check_moves(board, moves)
-        self.moves = moves
-        return self.moves
+            list[int]: A list of packed moves for the queen.
+        """
+        square = self.square
+        origin = square << 6
+        occupied = board.occupied
+        attacks = (rook_attacks(square, occupied) | bishop_attacks(square, occupied)) & ~board.get_occupancy(self.colour)
+        check_mask, pin_masks = board.check_info(self.colour)
+        attacks &= check_mask
+        pin = pin_masks.get(square)
+        if pin is not None:
+            attacks &= pin
+        moves = [origin | target for target in iter_bits(attacks)]
+
+        return moves
 
 
 class King(Piece):
@@ -411,19 +397,21 @@ class King(Piece):
     Inherits attributes and methods from the Piece class.
     """
 
-    def __init__(self, colour: Colour) -> None:
+    __slots__ = ()
+
+    def __init__(self, colour: int) -> None:
         """
         Initializes a king piece.
 
         Args:
-            colour (Colour): The colour of the king.
+            colour (int): The colour of the king.
 
         Returns:
             None
         """
-        super().__init__(colour, PieceType.KING)
+        super().__init__(colour, KING)
 
-    def generate_moves(self, board: 'Board') -> list[tuple[int, int]]:
+    def compute_moves(self, board: 'Board') -> list[int]:
         """
         Generates a list of possible moves for the king.
 
@@ -431,94 +419,35 @@ class King(Piece):
             board (Board): The board object representing the chess board.
 
         Returns:
-            list[tuple[int, int]]: A list of possible moves for the king.
-        """
-        moves = []
-        file, rank = self.get_position()
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                x, y = file + dx, rank + dy
-                if 0 <= x < 8 and 0 <= y < 8:
-                    target = board.get_piece(x, y)
-                    if target is None or target.colour != self.colour:
-                        moves.append((x, y))
-
-        moves = self.filter_self_check_moves(board, moves)
-        moves = self.filter_in_check_moves(board, moves)
-
-        self.moves = moves
+            list[int]: A list of packed moves for the king.
+        """
+        square = self.square
+        origin = square << 6
+        attacks = KING_ATTACKS[square] & ~board.get_occupancy(self.colour)
+        without_king = board.occupied ^ (1 << square)
+        moves = [
+            origin | target for target in iter_bits(attacks)
+            if not board.is_square_attacked(target, self.colour, without_king)
+        ]
+
         return moves
 
     def in_check(self, board: 'Board') -> bool:
         """
         Check if the king is in check.
 
+        Reads the board's cached check info rather than rescanning: the
+        check mask covers every square exactly when no piece is giving
+        check, so callers asking repeatedly in one position share a
+        single computation.
+
         Args:
             board (Board): The board object representing the chess board.
 
         Returns:
             bool: True if the king is in check, False otherwise.
         """
-        file, rank = self.get_position()
-
-        # Check for bishops and queens
-        for dx, dy in [(1, 1), (1, -1), (-1, -1), (-1, 1)]:
-            x, y = file + dx, rank + dy
-            while 0 <= x < 8 and 0 <= y < 8:
-                target = board.get_piece(x, y)
-                if target is not None:
-                    if target.colour != self.colour and (
-                        target.piece_type == PieceType.BISHOP or
-                        target.piece_type == PieceType.QUEEN
-                    ):
-                        return True
-                    break
-                x += dx
-                y += dy
-
-        # Check for rooks and queens
-        for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
-            x, y = file + dx, rank + dy
-            while 0 <= x < 8 and 0 <= y < 8:
-                target = board.get_piece(x, y)
-                if target is not None:
-                    if target.colour != self.colour and (
-                        target.piece_type == PieceType.ROOK or
-                        target.piece_type == PieceType.QUEEN
-                    ):
-                        return True
-                    break
-                x += dx
-                y += dy
-
-        # Check for knights
-        for dx, dy in [(1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)]:
-            if 0 <= file + dx < 8 and 0 <= rank + dy < 8:
-                target = board.get_piece(file + dx, rank + dy)
-                if target is not None and target.colour != self.colour and target.piece_type == PieceType.KNIGHT:
-                    return True
-
-        # Check for pawns
-        direction = 1 if self.colour == Colour.WHITE else -1
-        for attack in [-1, 1]:
-            target = board.get_piece(file + attack, rank + direction) if 0 <= file + attack < 8 else None
-            if target is not None and target.colour != self.colour and target.piece_type == PieceType.PAWN:
-                return True
-
-        # Check for king
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                x, y = file + dx, rank + dy
-                if 0 <= x < 8 and 0 <= y < 8:
-                    target = board.get_piece(x, y)
-                    if target is not None and target.colour != self.colour and target.piece_type == PieceType.KING:
-                        return True
-
-        return False
+        return board.check_info(self.colour)[0] != ALL_SQUARES
 
 
 # Map FEN characters directly to the piece classes
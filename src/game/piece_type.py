@@ -1,16 +1,18 @@
-from enum import Enum
+"""
+Integer constants representing the type of a piece.
 
+Each piece type is encoded as a 3 bit number, with 0 reserved for the
+absence of a piece. Plain ints keep the hot-path comparisons and table
+indexing in move generation at a single C-level operation.
+"""
 
-class PieceType(Enum):
-    """
-    Enum representing the type of a piece.
+NONE = 0
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
 
-    Each piece is encoded as a 4 bit number:
-    """
-    NONE = 0b0000
-    PAWN = 0b0001
-    KNIGHT = 0b0010
-    BISHOP = 0b0011
-    ROOK = 0b0100
-    QUEEN = 0b0101
-    KING = 0b0110
+# Display names indexed by piece type
+PIECE_TYPE_NAME = ('NONE', 'PAWN', 'KNIGHT', 'BISHOP', 'ROOK', 'QUEEN', 'KING')
@@ -0,0 +1,20 @@
+"""
+Zobrist keys for incremental position hashing.
+
+Each (piece, square) pair gets a fixed 64-bit random key; the hash of a
+position is the XOR of the keys of its occupied squares. Moving a piece
+updates the hash with two XORs (three on a capture), so the board can
+maintain it incrementally and use it to cache per-position work across
+transpositions.
+"""
+
+import random
+
+_generator = random.Random(0x5EED)
+
+# One key per (bitboard index, square); indexed the same way as
+# Board.bitboards, colour * 6 + piece_type - 1
+PIECE_KEYS = tuple(
+    tuple(_generator.getrandbits(64) for _ in range(64))
+    for _ in range(12)
+)
@@ -1,34 +1,86 @@
 import os
-from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw, ImageTk
 import tkinter as tk
 from src.game.piece import King, Piece, Knight, Bishop, Rook, Queen
-from src.game.colour import Colour
+from src.game.colour import BLACK, WHITE
 from src.game.board import Board
-from src.game.piece_type import PieceType
+from src.game.magics import iter_bits
+from src.game.piece_type import BISHOP, KING, KNIGHT, PAWN, QUEEN, ROOK
 
 
 # Map the binary representation of the pieces to their image names
 binary_to_image = {
     0b0000: None,
-    0b1001: 'white_pawn.png',
-    0b1010: 'white_knight.png',
-    0b1011: 'white_bishop.png',
-    0b1100: 'white_rook.png',
-    0b1101: 'white_queen.png',
-    0b1110: 'white_king.png',
-    0b0001: 'black_pawn.png',
-    0b0010: 'black_knight.png',
-    0b0011: 'black_bishop.png',
-    0b0100: 'black_rook.png',
-    0b0101: 'black_queen.png',
-    0b0110: 'black_king.png'
+    0b0001: 'white_pawn.png',
+    0b0010: 'white_knight.png',
+    0b0011: 'white_bishop.png',
+    0b0100: 'white_rook.png',
+    0b0101: 'white_queen.png',
+    0b0110: 'white_king.png',
+    0b1001: 'black_pawn.png',
+    0b1010: 'black_knight.png',
+    0b1011: 'black_bishop.png',
+    0b1100: 'black_rook.png',
+    0b1101: 'black_queen.png',
+    0b1110: 'black_king.png'
 }
 
+# Piece images resized and converted once per process; every BoardView
+# shares these instead of redoing the disk reads and resizes. The piece
+# encoding is a dense 4-bit int, so a 16-entry list indexed by encode()
+# replaces dict hashing on every draw
+_piece_image_cache = []
+
+# Static images (checkerboard background, move-hint overlays) rendered
+# once per process on first access, keyed by name
+_static_image_cache = {}
+
+# Promotion menu choice by clicked rank; the menu runs Queen, Rook,
+# Bishop, Knight from the promotion square inward for either colour
+promotion_class_by_rank = {
+    0: Queen, 7: Queen,
+    1: Rook, 6: Rook,
+    2: Bishop, 5: Bishop,
+    3: Knight, 4: Knight
+}
+
+# Ranks covered by the promotion menu, indexed by the promoting colour
+PROMOTION_RANKS = (frozenset((4, 5, 6, 7)), frozenset((0, 1, 2, 3)))
+
+
+def _prepare_sprite(image_path: str) -> Image.Image:
+    """
+    Decodes a piece sprite and brings it to square size.
+
+    Safe to run off the main thread: it touches only PIL, never Tk.
+
+    Args:
+        image_path (str): The path of the sprite file to load.
+
+    Returns:
+        Image.Image: The RGBA sprite at SQUARE_SIZE.
+    """
+    image = Image.open(image_path)
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    if image.size != (SQUARE_SIZE, SQUARE_SIZE):
+        image = image.resize((SQUARE_SIZE, SQUARE_SIZE), Image.LANCZOS)
+    return image
+
+# Pixel size of one board square; the canvas is 8 squares across
+SQUARE_SIZE = 100
+
 board_colours = ['#f1d9c0', '#a97a65']
 highlight_colour = '#5a7048'
 check_colour = '#ff0000'
 promotion_colour = '#8d7281'
 
+# Top-left pixel corner of each square, indexed by rank * 8 + file
+# (rank 7 is drawn at the top of the canvas)
+SQUARE_X = tuple((square & 7) * SQUARE_SIZE for square in range(64))
+SQUARE_Y = tuple((7 - (square >> 3)) * SQUARE_SIZE for square in range(64))
+
 
 class BoardView:
     """
@@ -37,8 +89,23 @@ class BoardView:
     Attributes:
         canvas (tk.Canvas): The canvas object on which the board is drawn.
         board (Board): The board object representing the chess board.
-        canvas_ids (list): A list of canvas item ids used to store the ids of the highlighted squares.
-        piece_images (dict): A dictionary mapping piece names to their corresponding image objects.
+        square_rect_ids (list): One persistent rectangle item per square,
+            recoloured in place for selection/check/promotion highlights.
+        square_piece_ids (list): One persistent image item per square,
+            whose image is swapped in place as pieces move.
+        hint_ids (list): The pooled move-hint image items, hidden when
+            unused.
+        hints_used (int): How many pooled hint items are showing.
+        king_check_shown (list): Whether each colour's king is currently
+            drawn with the check highlight, indexed by colour.
+        piece_images (list): Piece images indexed by the piece's 4-bit
+            encoding, with None at the unused slots.
+        board_background (ImageTk.PhotoImage): The pre-rendered checkerboard
+            image, kept referenced so Tk does not discard it.
+        capture_overlay (ImageTk.PhotoImage): The pre-rendered corner-triangle
+            hint stamped on capture target squares.
+        move_overlay (ImageTk.PhotoImage): The pre-rendered centre-dot hint
+            stamped on quiet move target squares.
         selected_piece (Piece): The piece that is currently selected.
         destination_square (tuple): The square to which the selected piece will be moved.
         promotion_pending (bool): A flag to track if a promotion is pending.
@@ -47,85 +114,218 @@ class BoardView:
     def __init__(self, canvas: tk.Canvas, board: Board) -> None:
         self.board = board
         self.canvas = canvas
-        self.canvas.pack()
-        self.canvas_ids = []
 
         self.piece_images = self.load_piece_images()
         self.selected_piece = None  # First clicked piece/square
         self.destination_square = None  # Second clicked square
         self.promotion_pending = False  # Track if promotion is pending
         self.draw_board()
+        self.capture_overlay = self.render_capture_overlay()
+        self.move_overlay = self.render_move_overlay()
+        self.create_square_items()
+        self.create_hint_items()
+        self.king_check_shown = [False, False]  # Indexed by colour
         self.draw_pieces(board)
         self.canvas.bind("<Button-1>", self.on_click)
 
-    def load_piece_images(self) -> dict[int, ImageTk.PhotoImage]:
+    def load_piece_images(self) -> list[ImageTk.PhotoImage]:
         """
-        Loads and returns a dictionary of piece images.
+        Loads and returns the list of piece images.
+
+        The images are read, resized and converted only on the first
+        call; later views reuse the module-level cache. When the baked
+        sprite atlas exists (see scripts/build_atlas.py), its pre-sized
+        tiles are cropped out instead, skipping the per-file decode and
+        resample entirely.
 
         Returns:
-            dict[int, ImageTk.PhotoImage]: A dictionary mapping piece names to their corresponding image objects.
-        """
-        images = {}
-        pieces_path = 'src/gui/images'
-        for piece, image_name in binary_to_image.items():
-            if image_name is not None:
-                image_path = os.path.join(pieces_path, image_name)
-                image = Image.open(image_path).convert('RGBA')
-                image = image.resize((100, 100))
-                images[piece] = ImageTk.PhotoImage(image)
-        return images
+            list[ImageTk.PhotoImage]: Piece images indexed by encoding.
+        """
+        if not _piece_image_cache:
+            _piece_image_cache.extend([None] * 16)
+            pieces_path = 'src/gui/images'
+            atlas_path = os.path.join(pieces_path, 'atlas.png')
+            if os.path.exists(atlas_path):
+                atlas = Image.open(atlas_path)
+                if atlas.mode != 'RGBA':
+                    atlas = atlas.convert('RGBA')
+                for piece, image_name in binary_to_image.items():
+                    if image_name is not None:
+                        x = ((piece & 7) - 1) * SQUARE_SIZE
+                        y = (piece >> 3) * SQUARE_SIZE
+                        tile = atlas.crop((x, y, x + SQUARE_SIZE, y + SQUARE_SIZE))
+                        _piece_image_cache[piece] = ImageTk.PhotoImage(tile)
+            else:
+                # PNG decode and resampling release the GIL, so the
+                # twelve sprites are prepared in parallel; only the Tk
+                # wrapping has to stay on this thread
+                codes = [piece for piece, name in binary_to_image.items()
+                         if name is not None]
+                paths = [os.path.join(pieces_path, binary_to_image[code])
+                         for code in codes]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    images = list(executor.map(_prepare_sprite, paths))
+                for code, image in zip(codes, images):
+                    _piece_image_cache[code] = ImageTk.PhotoImage(image)
+        return _piece_image_cache
 
     def draw_board(self) -> None:
         """
-        Draws the chess board on the canvas.
+        Draws the chess board background on the canvas.
+
+        The checkerboard is static, so it is composited once with PIL
+        and blitted as a single canvas image instead of creating 64
+        rectangle items.
+
+        Returns:
+            None
+        """
+        self.board_background = self.render_board_background()
+        self.canvas.create_image(0, 0, image=self.board_background, anchor='nw')
+
+    def render_board_background(self) -> ImageTk.PhotoImage:
+        """
+        Renders the checkerboard pattern into a single image.
+
+        Rendered on the first call; later views reuse the cached image.
+
+        Returns:
+            ImageTk.PhotoImage: The full-board background image.
+        """
+        if 'background' not in _static_image_cache:
+            size = SQUARE_SIZE
+            background = Image.new('RGB', (size * 8, size * 8))
+            tiles = [Image.new('RGB', (size, size), colour) for colour in board_colours]
+            for rank in range(8):
+                for file in range(8):
+                    background.paste(tiles[(file ^ rank) & 1], (file * size, rank * size))
+            _static_image_cache['background'] = ImageTk.PhotoImage(background)
+        return _static_image_cache['background']
+
+    def render_capture_overlay(self) -> ImageTk.PhotoImage:
+        """
+        Renders the capture move hint into a single reusable image.
+
+        The four corner triangles are drawn once with PIL, so marking a
+        capture square stamps one image instead of creating four
+        polygon items. Rendered on the first call; later views reuse
+        the cached image.
+
+        Returns:
+            ImageTk.PhotoImage: The transparent capture-hint overlay.
+        """
+        if 'capture' not in _static_image_cache:
+            size = SQUARE_SIZE
+            edge = size - 1
+            triangle_size = 16
+            overlay = Image.new('RGBA', (size, size))
+            draw = ImageDraw.Draw(overlay)
+            draw.polygon([(0, 0), (triangle_size, 0), (0, triangle_size)], fill=highlight_colour)
+            draw.polygon([(edge, 0), (edge - triangle_size, 0), (edge, triangle_size)], fill=highlight_colour)
+            draw.polygon([(0, edge), (triangle_size, edge), (0, edge - triangle_size)], fill=highlight_colour)
+            draw.polygon([(edge, edge), (edge - triangle_size, edge), (edge, edge - triangle_size)], fill=highlight_colour)
+            _static_image_cache['capture'] = ImageTk.PhotoImage(overlay)
+        return _static_image_cache['capture']
+
+    def render_move_overlay(self) -> ImageTk.PhotoImage:
+        """
+        Renders the quiet move hint into a single reusable image.
+
+        The centre dot is drawn once with PIL, so marking a move square
+        stamps one image instead of creating an oval item per target.
+        Rendered on the first call; later views reuse the cached image.
+
+        Returns:
+            ImageTk.PhotoImage: The transparent move-hint overlay.
+        """
+        if 'move' not in _static_image_cache:
+            size = SQUARE_SIZE
+            circle_offset = 63
+            overlay = Image.new('RGBA', (size, size))
+            draw = ImageDraw.Draw(overlay)
+            draw.ellipse([size - circle_offset, size - circle_offset,
+                          circle_offset, circle_offset], fill=highlight_colour)
+            _static_image_cache['move'] = ImageTk.PhotoImage(overlay)
+        return _static_image_cache['move']
+
+    def create_square_items(self) -> None:
+        """
+        Creates the persistent per-square canvas items.
+
+        Each square gets one transparent rectangle (recoloured for
+        highlights) and one empty image item (given a piece image when
+        occupied). Updates then mutate these in place instead of
+        creating and deleting canvas items on every move.
+
+        Returns:
+            None
+        """
+        self.square_rect_ids = []
+        self.square_piece_ids = []
+        for square in range(64):
+            x = SQUARE_X[square]
+            y = SQUARE_Y[square]
+            self.square_rect_ids.append(
+                self.canvas.create_rectangle(x, y, x + SQUARE_SIZE, y + SQUARE_SIZE,
+                                             fill='', outline='', width=0))
+            self.square_piece_ids.append(
+                self.canvas.create_image(x, y, image='', anchor='nw'))
+
+    def create_hint_items(self) -> None:
+        """
+        Creates the pooled move-hint canvas items.
+
+        A queen can reach at most 27 squares, so 28 hidden image items
+        cover any move list. Highlighting reuses the next free item by
+        moving it over the target square; resetting hides the used items
+        again, so hinting never creates or deletes canvas items.
 
         Returns:
             None
         """
-        size = 100
-        for i in range(8):
-            for j in range(8):
-                colour = board_colours[(i+j) % 2]
-                file1, rank1 = j*size, i*size
-                file2, rank2 = file1+size, rank1+size
-                self.canvas.create_rectangle(file1, rank1, file2, rank2, fill=colour, outline='')
+        self.hint_ids = [
+            self.canvas.create_image(0, 0, image='', anchor='nw', state='hidden')
+            for _ in range(28)
+        ]
+        self.hints_used = 0
 
     def draw_piece(self, piece: Piece, file: int, rank: int) -> None:
         """
         Draws a piece on the board at the specified file and rank.
 
+        Clearing a square is drawing None on it.
+
         Args:
-            piece (Piece): The piece to draw.
+            piece (Piece): The piece to draw, or None to empty the square.
             file (int): The file (column) index of the piece.
             rank (int): The rank (row) index of the piece.
 
         Returns:
             None
         """
-        # Resize the image to the square size using PIL
-        if piece is not None:
-            rank = 7 - rank
-            self.canvas.create_image(file*100, rank*100, image=self.piece_images[piece.encode()], anchor='nw')
-        else:
-            self.highlight_selected_square(file, rank, highlight=False)
+        image = self.piece_images[piece.code] if piece is not None else ''
+        self.canvas.itemconfigure(self.square_piece_ids[rank * 8 + file], image=image)
 
     def draw_pieces(self, board: Board) -> None:
         """
         Draws the pieces on the board.
 
+        Iterates the board's piece bitboards, so only occupied squares
+        are visited and each piece type's image is looked up once,
+        instead of scanning all 64 mailbox entries.
+
         Args:
             board (Board): The board object representing the chess board.
 
         Returns:
             None
         """
-        # Iterate over the board and draw the pieces
-        # The board is stored upside down so we need to reverse the ranks
-        for rank in range(7, -1, -1):
-            for file in range(8):
-                piece = board.get_piece(file, rank)
-                if piece is not None:
-                    self.draw_piece(piece, file, rank)
+        for colour in (WHITE, BLACK):
+            for piece_type in range(PAWN, KING + 1):
+                image = self.piece_images[(colour << 3) | piece_type]
+                bitboard = board.bitboards[colour * 6 + piece_type - 1]
+                for square in iter_bits(bitboard):
+                    self.canvas.itemconfigure(self.square_piece_ids[square], image=image)
 
     def on_click(self, event: tk.Event) -> None:
         """
@@ -157,7 +357,7 @@ class BoardView:
         """
         Returns the file and rank of the square clicked on the canvas.
 
-        Divides the x and y coordinates of the click event by 100 to get the file and rank.
+        Divides the x and y coordinates of the click event by the square size to get the file and rank.
 
         Args:
             event (tk.Event): The event object representing the click event.
@@ -165,8 +365,8 @@ class BoardView:
         Returns:
             tuple[int, int]: A tuple containing the file and rank of the clicked square.
         """
-        file = event.x // 100
-        rank = 7 - (event.y // 100)
+        file = event.x // SQUARE_SIZE
+        rank = 7 - (event.y // SQUARE_SIZE)
         return file, rank
 
     def handle_first_click(self, clicked_piece: Piece, file: int, rank: int) -> None:
@@ -189,7 +389,8 @@ class BoardView:
             self.redraw_square(clicked_piece, file, rank)
             moves = clicked_piece.generate_moves(self.board)
             for move in moves:
-                self.highlight_possible_square(move, self.board.get_piece(*move) is not None)
+                target = (move & 7, (move >> 3) & 7)
+                self.highlight_possible_square(target, self.board.get_piece(*target) is not None)
 
     def handle_second_click(self, file: int, rank: int) -> None:
         """
@@ -206,14 +407,14 @@ class BoardView:
             None
         """
         # Deselect if choosing an illegal square to move to
-        if (file, rank) not in self.selected_piece.moves:
+        if not (self.selected_piece.targets >> (rank * 8 + file)) & 1:
             self.deselect_piece()
             return
 
         self.move_selected_piece(file, rank)
 
         # Check if the pawn has reached the end of the board
-        if self.selected_piece.get_type() == PieceType.PAWN and (rank == 0 or rank == 7):
+        if self.selected_piece.get_type() == PAWN and (rank == 0 or rank == 7):
             self.promotion_pending = True
             self.draw_promotion_squares(self.destination_square)
         else:
@@ -242,22 +443,12 @@ class BoardView:
             return
 
         # Validate the rank for promotion based on piece colour
-        if self.selected_piece.colour == Colour.WHITE and rank not in (4, 5, 6, 7):
-            return  # Invalid click for white
-        elif self.selected_piece.colour == Colour.BLACK and rank not in (0, 1, 2, 3):
-            return  # Invalid click for black
+        if rank not in PROMOTION_RANKS[self.selected_piece.colour]:
+            return  # Clicked outside the menu
 
         original_file, original_rank = self.selected_piece.file, self.selected_piece.rank
 
-        promotion_piece = None
-        if rank == 0 or rank == 7:
-            promotion_piece = Queen(self.selected_piece.colour)
-        elif rank == 1 or rank == 6:
-            promotion_piece = Rook(self.selected_piece.colour)
-        elif rank == 2 or rank == 5:
-            promotion_piece = Bishop(self.selected_piece.colour)
-        elif rank == 3 or rank == 4:
-            promotion_piece = Knight(self.selected_piece.colour)
+        promotion_piece = promotion_class_by_rank[rank](self.selected_piece.colour)
 
         self.selected_piece = self.board.promote_pawn(self.selected_piece, promotion_piece, self.destination_square)
         self.draw_promotion_squares(self.destination_square, remove=True)
@@ -277,8 +468,8 @@ class BoardView:
             None
         """
         # Check if the king was in check (need to rehighlight the square)
-        king = self.board.black_king if self.selected_piece.colour == Colour.BLACK else self.board.black_king
-        king_in_check = self.is_king_in_check(king) and self.selected_piece == king
+        king = self.board.kings[self.selected_piece.colour]
+        king_in_check = self.selected_piece is king and self.is_king_in_check(king)
 
         self.highlight_selected_square(self.selected_piece.file, self.selected_piece.rank,
                                        highlight=False, check=king_in_check)
@@ -325,21 +516,21 @@ class BoardView:
         file, rank = square
 
         start, end = (0, 4) if rank == 0 else (4, 8)  # Adjusted end values for both cases
-        piece_colour = Colour.WHITE if rank == 7 else Colour.BLACK
+        piece_colour = WHITE if rank == 7 else BLACK
 
-        pieces = [Queen(piece_colour), Rook(piece_colour), Bishop(piece_colour), Knight(piece_colour)]
+        menu_types = [QUEEN, ROOK, BISHOP, KNIGHT]
 
         # Reverse the list for white (ensures piece order)
         if rank == 7:
-            pieces = pieces[::-1]
+            menu_types = menu_types[::-1]
 
         for i in range(start, end):
-            piece = pieces[i-start]
             if not remove:
                 self.highlight_selected_square(file, i, promotion=True)
-                self.draw_piece(piece, file, i)
+                image = self.piece_images[(piece_colour << 3) | menu_types[i - start]]
+                self.canvas.itemconfigure(self.square_piece_ids[i * 8 + file], image=image)
             else:
-                self.redraw_square(None, file, i)
+                self.highlight_selected_square(file, i, highlight=False)
                 self.redraw_square(self.board.get_piece(file, i), file, i)
 
     def update_board_view(self, original_file: int, original_rank: int, file: int, rank: int) -> None:
@@ -347,7 +538,7 @@ class BoardView:
         Updates the board view after a move is made.
 
         Unhighlights the original square, empties the original square, empties the possible move squares,
-        empties and redraws the destination square, and redraws the selected piece.
+        and redraws the destination square with the moved piece.
 
         Checks if the opposite king is in check, highlights the king if in check, and checks for checkmate.
 
@@ -369,36 +560,41 @@ class BoardView:
         # Empty the possible move squares
         self.reset_possible_moves()
 
-        # Empty and redraw the destination square
-        self.redraw_square(None, file, rank)
+        # Redraw the destination square with the moved piece
         self.redraw_square(self.selected_piece, file, rank)
 
-        opp_king = self.board.white_king if self.selected_piece.colour == Colour.BLACK else self.board.black_king
-        own_king = self.board.black_king if self.selected_piece.colour == Colour.BLACK else self.board.white_king
+        opp_king = self.board.kings[self.selected_piece.colour ^ 1]
+        own_king = self.board.kings[self.selected_piece.colour]
 
         # Check if move has put the opposite king in check
         if self.is_king_in_check(opp_king):
             self.highlight_king_if_in_check(opp_king)
 
+            # Paint the finished move before the checkmate scan runs
+            self.canvas.update_idletasks()
+
             # Check for checkmate
             if self.is_king_in_checkmate():
                 print("Checkmate")
                 self.board.game_active = False
 
-        # Unhighlight own king if it is no longer in check
-        self.highlight_king_if_in_check(own_king)
+        # Unhighlight own king if it was shown in check before the move
+        if self.king_check_shown[own_king.colour]:
+            self.highlight_king_if_in_check(own_king)
 
     def reset_possible_moves(self) -> None:
         """
         Resets the possible move squares.
 
-        Empties the canvas ids list and deletes the highlighted squares.
+        Hides the pooled hint items that are showing and returns them to
+        the pool.
 
         Returns:
             None
         """
-        for ids in self.canvas_ids:
-            self.canvas.delete(ids)
+        for item in self.hint_ids[:self.hints_used]:
+            self.canvas.itemconfigure(item, state='hidden')
+        self.hints_used = 0
 
     def highlight_selected_square(self, file: int, rank: int, highlight: bool = True,
                                   check: bool = False, promotion: bool = False) -> None:
@@ -407,7 +603,7 @@ class BoardView:
 
         If check, highlight the square red to indicate check.
         If highlight, highlight the square with the highlight colour (indicating the selected piece).
-        Else, highlight the square with the original colour.
+        Else, clear the highlight so the board background shows through.
 
         Args:
             file (int): The file (column) index of the square.
@@ -419,17 +615,15 @@ class BoardView:
         Returns:
             None
         """
-        size = 100
-        rank = 7 - rank
-        file1, rank1 = file*size, rank*size
-        file2, rank2 = file1+size, rank1+size
         if check:
             colour = check_colour
         elif promotion:
             colour = promotion_colour
         else:
-            colour = highlight_colour if highlight else board_colours[(file+rank) % 2]
-        self.canvas.create_rectangle(file1, rank1, file2, rank2, fill=colour, outline='')
+            # An empty fill leaves the square transparent, showing the
+            # checkerboard background underneath
+            colour = highlight_colour if highlight else ''
+        self.canvas.itemconfigure(self.square_rect_ids[rank * 8 + file], fill=colour)
 
     def redraw_square(self, piece: Piece, file: int, rank: int) -> None:
         """
@@ -451,8 +645,10 @@ class BoardView:
         """
         Highlights the possible move squares on the canvas.
 
-        If the move is a capture, highlights the square with four triangles in the corners.
-        Else, highlights the square with a circle.
+        If the move is a capture, stamps the corner-triangle overlay on
+        the square; otherwise stamps the centre-dot overlay. Both hints
+        reuse the next pooled image item, so each target costs two item
+        updates and no allocation.
 
         Args:
             move (tuple): The file and rank of the square to highlight.
@@ -462,45 +658,12 @@ class BoardView:
             None
         """
         file, rank = move
-        size = 100
-        rank = 7 - rank
-        file1, rank1 = file*size, rank*size
-        file2, rank2 = file1+size, rank1+size
-        if capture:
-            ids = self.draw_highlight_triangles(file1, rank1, file2, rank2)
-            for id in ids:
-                self.canvas_ids.append(id)
-        else:
-            circle_offset = 63
-            ids = self.canvas.create_oval(
-                file1+circle_offset, rank1+circle_offset, file2-circle_offset,
-                rank2-circle_offset, fill=highlight_colour, outline='')
-            self.canvas_ids.append(ids)
-
-    def draw_highlight_triangles(self, file1: int, rank1: int, file2: int, rank2: int) -> list[int]:
-        """
-        Draws four triangles in the corners of the square to indicate a capture move.
-
-        Args:
-            file1 (int): The x-coordinate of the top-left corner of the square.
-            rank1 (int): The y-coordinate of the top-left corner of the square.
-            file2 (int): The x-coordinate of the bottom-right corner of the square.
-            rank2 (int): The y-coordinate of the bottom-right corner of the square.
-
-        Returns:
-            list[int]: A list of ids of the triangles drawn on the canvas.
-        """
-        ids = []
-        trainagle_size = 16
-        ids.append(self.canvas.create_polygon(
-            file1, rank1, file1+trainagle_size, rank1, file1, rank1+trainagle_size, fill=highlight_colour, outline=''))
-        ids.append(self.canvas.create_polygon(
-            file2, rank1, file2-trainagle_size, rank1, file2, rank1+trainagle_size, fill=highlight_colour, outline=''))
-        ids.append(self.canvas.create_polygon(
-            file1, rank2, file1+trainagle_size, rank2, file1, rank2-trainagle_size, fill=highlight_colour, outline=''))
-        ids.append(self.canvas.create_polygon(
-            file2, rank2, file2-trainagle_size, rank2, file2, rank2-trainagle_size, fill=highlight_colour, outline=''))
-        return ids
+        square = rank * 8 + file
+        overlay = self.capture_overlay if capture else self.move_overlay
+        item = self.hint_ids[self.hints_used]
+        self.hints_used += 1
+        self.canvas.coords(item, SQUARE_X[square], SQUARE_Y[square])
+        self.canvas.itemconfigure(item, image=overlay, state='normal')
 
     def is_king_in_check(self, king: King) -> bool:
         """
@@ -518,7 +681,9 @@ class BoardView:
         """
         Highlights the king if it is in check.
 
-        Highlights the king's square with the check colour.
+        Highlights the king's square with the check colour, and records
+        whether the highlight is showing so later moves can skip the
+        clear when there is nothing to clear.
 
         Args:
             king (King): The king to highlight.
@@ -529,9 +694,11 @@ class BoardView:
         # Remove any highlight on the king's square
         self.highlight_selected_square(king.file, king.rank, highlight=False)
 
-        if self.is_king_in_check(king):
+        in_check = self.is_king_in_check(king)
+        if in_check:
             # Highlight the king if in check
             self.highlight_selected_square(king.file, king.rank, check=True)
+        self.king_check_shown[king.colour] = in_check
 
         self.redraw_square(king, king.file, king.rank)
 
@@ -542,7 +709,7 @@ class BoardView:
         Returns:
             bool: True if the king is in checkmate, False otherwise.
         """
-        king = self.board.white_king if self.selected_piece.colour == Colour.BLACK else self.board.black_king
+        king = self.board.kings[self.selected_piece.colour ^ 1]
 
         if not self.is_king_in_check(king):
             return False
@@ -17,7 +17,10 @@ class MainWindow:
         self.window = tk.Tk()
         self.window.title("Chess")
         self.window.geometry("800x800")
-        self.canvas = tk.Canvas(self.window, width=800, height=800)
+        # No focus ring or border: the canvas is pure board, and the
+        # extra pixels would offset every click-to-square calculation
+        self.canvas = tk.Canvas(self.window, width=800, height=800,
+                                highlightthickness=0, borderwidth=0)
         self.canvas.pack()
         self.board_view = BoardView(self.canvas, board)
 